@@ -6,6 +6,7 @@ Uses the two public APIs:
 """
 
 import asyncio
+import json
 from typing import Any, Dict, Optional
 
 import aiohttp
@@ -13,20 +14,51 @@ import aiohttp
 from .const import API_GET_DEVICE_LIST, API_UPDATE_MQTT_STATE
 from .logger import SmartLogger
 
+try:
+    # Optional: orjson serializes payloads a few times faster than the
+    # stdlib. The API payloads here are small, so this is a nicety, not
+    # a requirement.
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:  # pragma: no cover - depends on environment
+    _json_dumps = json.dumps
+
 
 class APIClient:
     """Client for SYDPOWER public device APIs."""
 
+    # One pooled session shared by all clients in the process, so TCP
+    # (and TLS) connections are reused across reconnect cycles and
+    # config entries instead of re-handshaking per request. Refcounted:
+    # the last client to close() tears the session down.
+    _shared_session: Optional[aiohttp.ClientSession] = None
+    _shared_users: int = 0
+
     def __init__(self, api_token: str):
         self._api_token = api_token
         self._session: Optional[aiohttp.ClientSession] = None
         self._logger = SmartLogger(__name__)
 
     async def _ensure_session(self):
-        """Ensure that a persistent aiohttp session exists."""
-        if self._session is None or self._session.closed:
-            timeout = aiohttp.ClientTimeout(total=15)
-            self._session = aiohttp.ClientSession(timeout=timeout)
+        """Ensure this client holds a reference to the shared session."""
+        if self._session is not None and not self._session.closed:
+            return
+        if APIClient._shared_session is None or APIClient._shared_session.closed:
+            APIClient._shared_session = aiohttp.ClientSession(
+                timeout=aiohttp.ClientTimeout(total=15, connect=5),
+                json_serialize=_json_dumps,
+                connector=aiohttp.TCPConnector(
+                    limit=32,
+                    limit_per_host=8,
+                    ttl_dns_cache=600,
+                    keepalive_timeout=60,
+                ),
+            )
+        if self._session is None:
+            APIClient._shared_users += 1
+        self._session = APIClient._shared_session
 
     async def _request(
         self, url: str, params: Dict[str, Any]
@@ -163,11 +195,19 @@ class APIClient:
             return False
 
     async def close(self):
-        """Close the session."""
-        if self._session:
+        """Release this client's reference to the shared session.
+
+        The underlying session is only closed once no client holds a
+        reference, so other config entries keep their pooled connections.
+        """
+        if self._session is None:
+            return
+        self._session = None
+        APIClient._shared_users = max(0, APIClient._shared_users - 1)
+        if APIClient._shared_users == 0 and APIClient._shared_session is not None:
             try:
-                await self._session.close()
+                await APIClient._shared_session.close()
             except Exception as e:
                 self._logger.error("Error closing API session: %s", e)
             finally:
-                self._session = None
+                APIClient._shared_session = None
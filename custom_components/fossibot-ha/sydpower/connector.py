@@ -1,9 +1,16 @@
 """Main connector for Fossibot/Sydpower integration via local MQTT broker."""
 
 import asyncio
-import time
+import random
+from contextlib import suppress
+from types import MappingProxyType
 from typing import Any, Dict, Optional
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - optional speedup
+    uvloop = None
+
 from .logger import SmartLogger
 from .api_client import APIClient
 from .mqtt_client import MQTTClient
@@ -17,7 +24,8 @@ from .modbus import (
 )
 from .const import REGISTER_MODBUS_ADDRESS, DEFAULT_MQTT_PORT
 
-COMMANDS = {
+# Read-only view: command bytes are shared and must not be mutated
+COMMANDS = MappingProxyType({
     "REGRequestSettings": REGRequestSettings,
     "REGDisableUSBOutput": REGDisableUSBOutput,
     "REGEnableUSBOutput": REGEnableUSBOutput,
@@ -31,7 +39,7 @@ COMMANDS = {
     "REGEnableLEDFlash": REGEnableLEDFlash,
     "REGDisableACSilentChg": REGDisableACSilentChg,
     "REGEnableACSilentChg": REGEnableACSilentChg,
-}
+})
 
 
 class SydpowerConnector:
@@ -43,6 +51,8 @@ class SydpowerConnector:
         mqtt_host: str,
         mqtt_port: int = DEFAULT_MQTT_PORT,
         mqtt_username: str = "",
+        min_reconnection_interval: int = 5,
+        max_reconnection_attempts: int = 10,
     ):
         self.api_token = api_token
         self.mqtt_host = mqtt_host
@@ -50,57 +60,119 @@ class SydpowerConnector:
         self.mqtt_username = mqtt_username
         self._logger = SmartLogger(__name__)
 
+        # Prefer uvloop when available — same asyncio API, lower per-task
+        # scheduling overhead. No-op if the policy is already installed or
+        # a foreign loop is running.
+        if uvloop is not None and not isinstance(
+            asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy
+        ):
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+                self._logger.debug("uvloop event loop policy installed")
+
         self.api_client: Optional[APIClient] = None
         self.mqtt_client: Optional[MQTTClient] = None
         self.loop: Optional[asyncio.AbstractEventLoop] = None
 
         # Connection management
         self._connection_lock = asyncio.Lock()
+        self._connect_task: Optional[asyncio.Task] = None
+        self._inflight_poll: Optional[asyncio.Task] = None
+        self._reconnect_task: Optional[asyncio.Task] = None
         self._reconnection_in_progress = False
         self._reconnection_event = asyncio.Event()
         self._reconnection_event.set()
-        self._last_reconnection_attempt = 0
-        self._min_reconnection_interval = 5
+        # Monotonic (loop.time) timestamp of the last reconnection attempt
+        self._last_reconnection_attempt = 0.0
+        self._min_reconnection_interval = min_reconnection_interval
+        self._max_reconnection_attempts = max_reconnection_attempts
 
         # Device data
         self.devices: Dict[str, Any] = {}
+        self._device_id_list: tuple = ()
+
+        # Monotonic timestamp of the last command sent per device, used
+        # to pace commands at 1 Hz without taxing single commands
+        self._last_command_time: Dict[str, float] = {}
+
+        # Cached read commands keyed by (mac, func, addr, count). The
+        # address/count are part of the key, so an updated API record
+        # simply misses the stale entry.
+        self._read_cmd_cache: Dict[tuple, Any] = {}
 
-        # Last successful connection timestamp
-        self._last_successful_communication = 0
+        # Freshness of the last successful poll, so a poll that just ran
+        # (e.g. during connect verification) can serve the next get_data
+        # without another 5s round trip.
+        self._last_poll_time = 0.0
+        self._poll_result_ttl = 2.0
+
+    async def _await_reconnection(self, timeout: float) -> bool:
+        """Wait out any in-progress reconnection.
+
+        Returns True once clear to proceed, False on timeout.
+        """
+        if not self._reconnection_in_progress:
+            return True
+        self._logger.debug(
+            "Reconnection in progress, waiting up to %.0fs...", timeout
+        )
+        try:
+            if not self._reconnection_event.is_set():
+                async with asyncio.timeout(timeout):
+                    await self._reconnection_event.wait()
+            return True
+        except asyncio.TimeoutError:
+            self._logger.warning("Timeout waiting for reconnection")
+            return False
 
     async def connect(self) -> bool:
         """Connect to the API and local MQTT broker. Returns True if successful."""
-        if self._reconnection_in_progress:
-            self._logger.debug(
-                "Connection attempt while reconnection in progress, waiting..."
-            )
-            try:
-                await asyncio.wait_for(
-                    self._reconnection_event.wait(), timeout=15.0
-                )
-            except asyncio.TimeoutError:
-                self._logger.error("Timeout waiting for reconnection")
-                return False
-
-            if self.mqtt_client and self.mqtt_client.connected.is_set():
-                return True
+        if not await self._await_reconnection(15.0):
+            return False
 
         # Already connected
         if self.mqtt_client and self.mqtt_client.connected.is_set():
             return True
 
-        # Acquire lock to prevent concurrent connection attempts
+        # Singleflight: the lock is held only long enough to decide
+        # whether an attempt is already in flight — never across the
+        # network waits themselves. Concurrent callers piggyback on the
+        # single in-flight attempt instead of queueing behind the lock.
         try:
-            lock_acquired = await asyncio.wait_for(
-                self._connection_lock.acquire(), timeout=10.0
-            )
+            async with asyncio.timeout(10.0):
+                await self._connection_lock.acquire()
         except asyncio.TimeoutError:
             self._logger.error("Timeout acquiring connection lock")
             return False
 
-        if not lock_acquired:
+        try:
+            if self.mqtt_client and self.mqtt_client.connected.is_set():
+                return True
+            if self._connect_task is None or self._connect_task.done():
+                self._connect_task = asyncio.ensure_future(
+                    self._do_connect()
+                )
+            connect_task = self._connect_task
+        finally:
+            self._connection_lock.release()
+
+        try:
+            return await connect_task
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._logger.error("Error during connection: %s", e)
             return False
 
+    async def _do_connect(self, verify: bool = True) -> bool:
+        """Run the actual connect chain (API lookup, MQTT connect, verify).
+
+        With verify=False the broker CONNACK is trusted and the data
+        round-trip is skipped — used by early reconnection attempts where
+        the device was responsive moments ago.
+        """
         try:
             if self.loop is None:
                 self.loop = asyncio.get_running_loop()
@@ -119,11 +191,11 @@ class SydpowerConnector:
 
             # Step 1: Get device list from API
             self._logger.info("Getting device list from API")
-            self.devices = await asyncio.wait_for(
-                self.api_client.get_devices(), timeout=15.0
-            )
+            async with asyncio.timeout(15.0):
+                self.devices = await self.api_client.get_devices()
 
             device_ids = list(self.devices.keys())
+            self._device_id_list = tuple(device_ids)
 
             if not device_ids:
                 self._logger.error("No devices returned from API")
@@ -144,20 +216,29 @@ class SydpowerConnector:
             )
 
             try:
-                await asyncio.wait_for(
-                    self.mqtt_client.connected.wait(), timeout=15.0
-                )
+                if not self.mqtt_client.connected.is_set():
+                    async with asyncio.timeout(15.0):
+                        await self.mqtt_client.connected.wait()
             except asyncio.TimeoutError:
                 self._logger.error("Timeout waiting for MQTT connection")
                 await self._cleanup()
                 return False
 
-            # Step 3: Verify connection (get initial data)
+            # Step 3: Verify connection (get initial data). Skipped on
+            # fast reconnects — the ~5s round-trip is wasted time when
+            # the socket just bounced and the device was healthy.
+            if not verify:
+                self._logger.info(
+                    "Connected to local MQTT broker at %s:%d "
+                    "(verification skipped)",
+                    self.mqtt_host, self.mqtt_port,
+                )
+                return True
+
             try:
-                if await asyncio.wait_for(
-                    self._verify_connection(), timeout=15.0
-                ):
-                    self._last_successful_communication = time.time()
+                async with asyncio.timeout(15.0):
+                    verified = await self._verify_connection()
+                if verified:
                     self._logger.info(
                         "Connected to local MQTT broker at %s:%d",
                         self.mqtt_host, self.mqtt_port,
@@ -173,7 +254,6 @@ class SydpowerConnector:
                     "Device not responding — accepting broker connection. "
                     "Integration will recover when device is reachable.",
                 )
-                self._last_successful_communication = time.time()
                 return True
 
             self._logger.error("Failed to connect to MQTT broker")
@@ -187,32 +267,37 @@ class SydpowerConnector:
             self._logger.error("Error during connection: %s", e)
             await self._cleanup()
             return False
-        finally:
-            if self._connection_lock.locked():
-                self._connection_lock.release()
 
     async def _verify_connection(self) -> bool:
         """Verify the connection by testing device responsiveness."""
         if not self.mqtt_client or not self.mqtt_client.connected.is_set():
             return False
 
+        # Fast path: a retained message on a device topic means the broker
+        # already delivered the last known state on subscribe — no need for
+        # the full two-stage request/response roundtrip.
+        with suppress(asyncio.TimeoutError):
+            async with asyncio.timeout(2.0):
+                await self.mqtt_client.retained_seen.wait()
+            self._merge_device_fields()
+            self._logger.debug(
+                "Connection verified via retained message"
+            )
+            return True
+
         self._logger.debug("Stage 1: waiting for initial func 03 response...")
 
         try:
-            await asyncio.wait_for(
-                self.mqtt_client.data_updated.wait(), timeout=5.0
-            )
-            self._logger.debug(
-                "Initial response received, waiting 1s for settings..."
-            )
-            await asyncio.sleep(1.0)
+            # Wait on the count of on-connect responses rather than a
+            # fixed settling sleep; partial arrivals are still accepted.
+            try:
+                async with asyncio.timeout(5.0):
+                    await self.mqtt_client.all_devices_reported.wait()
+            except asyncio.TimeoutError:
+                if self.mqtt_client.data_seq == 0:
+                    raise
 
-            if self.mqtt_client.devices:
-                for mac, fields in self.mqtt_client.devices.items():
-                    if mac in self.devices:
-                        self.devices[mac].update(fields)
-                    else:
-                        self.devices[mac] = fields
+            self._merge_device_fields()
 
             field_count = sum(
                 len(v) for v in self.mqtt_client.devices.values()
@@ -233,28 +318,19 @@ class SydpowerConnector:
                 field_count,
             )
 
-            # Stage 2: Fresh poll
-            self.mqtt_client.clear_message_cache()
-            self.mqtt_client.data_updated.clear()
-
-            for device_mac in list(self.devices.keys()):
-                self._send_read_request(device_mac)
-
-            await asyncio.wait_for(
-                self.mqtt_client.data_updated.wait(), timeout=5.0
-            )
-            await asyncio.sleep(1.0)
-
-            fresh_field_count = sum(
-                len(v) for v in self.mqtt_client.devices.values()
-            ) if self.mqtt_client.devices else 0
-
-            if fresh_field_count == 0:
+            # Stage 2: fresh poll through the same path get_data uses,
+            # so the result is persisted and the first refresh after
+            # connect can reuse it instead of polling again.
+            if not await self._poll_devices():
                 self._logger.warning(
                     "Stage 2 failed: device did not respond to fresh poll"
                 )
                 return False
 
+            fresh_field_count = sum(
+                len(v) for v in self.mqtt_client.devices.values()
+            ) if self.mqtt_client.devices else 0
+
             self._logger.info(
                 "Connection verified — stage 1: %d fields, stage 2: %d fields",
                 field_count, fresh_field_count,
@@ -270,6 +346,21 @@ class SydpowerConnector:
             self._logger.error("Error during connection verification: %s", e)
             return False
 
+    def _merge_device_fields(self) -> None:
+        """Merge MQTT-received fields into self.devices in place.
+
+        Mutating the existing dicts (rather than rebuilding them) keeps
+        `self.devices` identity and insertion order stable for callers
+        holding a reference.
+        """
+        if not self.mqtt_client or not self.mqtt_client.devices:
+            return
+        for mac, fields in self.mqtt_client.devices.items():
+            if mac in self.devices:
+                self.devices[mac].update(fields)
+            else:
+                self.devices[mac] = fields
+
     async def _handle_device_state(self, device_mac: str, online: bool):
         """Handle device state changes — sync with platform API."""
         # Look up the raw device_id (with colons) for the API call
@@ -294,25 +385,17 @@ class SydpowerConnector:
     async def get_data(self) -> Dict[str, Any]:
         """Get the latest data from devices."""
         # Wait for any in-progress reconnection
-        if self._reconnection_in_progress:
-            self._logger.debug(
-                "Reconnection in progress, waiting before getting data..."
-            )
-            try:
-                await asyncio.wait_for(
-                    self._reconnection_event.wait(), timeout=30.0
-                )
-            except asyncio.TimeoutError:
-                self._logger.warning("Timeout waiting for reconnection")
-                return {}
+        if not await self._await_reconnection(30.0):
+            return {}
 
         # Ensure connected
         if not self.mqtt_client or not self.mqtt_client.connected.is_set():
             self._logger.debug("MQTT client not connected, calling connect()")
             try:
-                if not await asyncio.wait_for(self.connect(), timeout=30.0):
-                    self._logger.error("Failed to connect")
-                    return {}
+                async with asyncio.timeout(30.0):
+                    if not await self.connect():
+                        self._logger.error("Failed to connect")
+                        return {}
             except asyncio.TimeoutError:
                 self._logger.error("Connection timeout")
                 return {}
@@ -324,7 +407,26 @@ class SydpowerConnector:
             self._logger.warning("No devices available to request data from")
             return {}
 
-        data = await self._poll_devices()
+        # A poll that just completed (e.g. connect verification) is
+        # fresh enough to serve directly.
+        if (
+            self._last_poll_time
+            and self.loop.time() - self._last_poll_time
+            < self._poll_result_ttl
+        ):
+            return self.devices
+
+        # The device set only changes at connect time, so reuse the
+        # tuple snapshotted there rather than re-materializing the keys.
+        device_macs = self._device_id_list or tuple(self.devices)
+
+        # Singleflight: overlapping get_data callers share one poll
+        # instead of issuing duplicate read requests.
+        if self._inflight_poll is None or self._inflight_poll.done():
+            self._inflight_poll = asyncio.ensure_future(
+                self._poll_devices(device_macs)
+            )
+        data = await self._inflight_poll
         if data:
             return data
 
@@ -343,44 +445,46 @@ class SydpowerConnector:
         self._logger.warning("Poll timed out and no cached data available")
         return {}
 
-    async def _poll_devices(self) -> Dict[str, Any]:
+    async def _poll_devices(self, device_macs=None) -> Dict[str, Any]:
         """Send func 03 and func 04 reads and wait for settings + sensor responses."""
-        if not self.mqtt_client:
+        # Bind once: cheaper than repeated attribute loads and immune to
+        # the reference being nulled mid-poll by cleanup.
+        client = self.mqtt_client
+        if not client:
             return {}
 
+        if device_macs is None:
+            device_macs = tuple(self.devices)
+
         updated = False
         for func in (3, 4):
-            self.mqtt_client.clear_message_cache()
-            self.mqtt_client.data_updated.clear()
+            client.clear_message_cache()
+            poll_seq = client.data_seq
+            client.expect_responses(device_macs)
             self._logger.debug(
                 "Poll: cache cleared, sending func %d to %s",
-                func, list(self.devices.keys()),
+                func, device_macs,
             )
 
-            for device_mac in self.devices:
-                if not self.mqtt_client:
-                    return {}
-                self._send_read_request(device_mac, func)
+            self._publish_read_requests(func, device_macs)
 
             try:
-                await asyncio.wait_for(
-                    self.mqtt_client.data_updated.wait(), timeout=5.0
-                )
-                self._logger.debug(
-                    "Poll: first response for func %d arrived, waiting 1s for settings...",
-                    func,
-                )
-                await asyncio.sleep(1.0)
+                try:
+                    async with asyncio.timeout(5.0):
+                        await client.all_devices_reported.wait()
+                except asyncio.TimeoutError:
+                    # Some devices missed the window — keep whatever arrived
+                    if client.data_seq == poll_seq:
+                        raise
+                    self._logger.debug(
+                        "Poll: partial responses for func %d (missing: %s)",
+                        func, sorted(client.pending_devices),
+                    )
 
-                if self.mqtt_client.devices:
-                    self._last_successful_communication = time.time()
-                    for mac, fields in self.mqtt_client.devices.items():
-                        if mac in self.devices:
-                            self.devices[mac].update(fields)
-                        else:
-                            self.devices[mac] = fields
+                if client.devices:
+                    self._merge_device_fields()
 
-                    for mac in self.devices:
+                    for mac in device_macs:
                         data = self.devices.get(mac, {})
                         user_fields = [
                             k for k in data if not k.startswith("_")
@@ -399,64 +503,79 @@ class SydpowerConnector:
                 self._logger.error("Error during poll: %s", e)
 
         if updated:
+            self._last_poll_time = self.loop.time()
             return self.devices
         return {}
 
-    def _send_read_request(self, device_mac: str, func: int = 3) -> None:
-        """Send either Modbus func 03 (holding) or func 04 (input) read using per-device address and count from API."""
-        if not self.mqtt_client:
-            return
-
+    def _build_read_request(self, device_mac: str, func: int = 3):
+        """Build a Modbus func 03 (holding) or func 04 (input) read command
+        using per-device address and count from the API."""
         device_info = self.devices.get(device_mac, {})
         modbus_addr = device_info.get(
             "_modbus_address", REGISTER_MODBUS_ADDRESS
         )
         modbus_count = device_info.get("_modbus_count", 80)
 
+        cache_key = (device_mac, func, modbus_addr, modbus_count)
+        command_bytes = self._read_cmd_cache.get(cache_key)
+        if command_bytes is not None:
+            return command_bytes
+
         if func == 3:
-            # Send func 03 (holding registers)
-            command_bytes_03 = get_read_modbus(modbus_addr, modbus_count)
-            self.mqtt_client.publish_command(device_mac, command_bytes_03)
-            self._logger.debug(
-                "Sent func 03 to %s (addr=%d, count=%d)",
-                device_mac, modbus_addr, modbus_count,
-            )
+            command_bytes = get_read_modbus(modbus_addr, modbus_count)
         elif func == 4:
-            # Send func 04 (input registers)
-            command_bytes_04 = get_read_input_modbus(modbus_addr, modbus_count)
-            self.mqtt_client.publish_command(device_mac, command_bytes_04)
-            self._logger.debug(
-                "Sent func 04 to %s (addr=%d, count=%d)",
-                device_mac, modbus_addr, modbus_count,
-            )
+            command_bytes = get_read_input_modbus(modbus_addr, modbus_count)
         else:
             self._logger.error("Invalid Modbus func: %d", func)
+            return None
+
+        self._read_cmd_cache[cache_key] = command_bytes
+
+        self._logger.debug(
+            "Built func %02d read for %s (addr=%d, count=%d)",
+            func, device_mac, modbus_addr, modbus_count,
+        )
+        return command_bytes
+
+    def _send_read_request(self, device_mac: str, func: int = 3) -> None:
+        """Send a Modbus read to a single device."""
+        if not self.mqtt_client:
+            return
+        command_bytes = self._build_read_request(device_mac, func)
+        if command_bytes is not None:
+            self.mqtt_client.publish_command(device_mac, command_bytes)
+
+    def _publish_read_requests(self, func: int = 3, device_macs=None) -> None:
+        """Build read commands for all devices, then publish them in one pass."""
+        if not self.mqtt_client:
+            return
+        if device_macs is None:
+            device_macs = tuple(self.devices)
+        pairs = [
+            (mac, command_bytes)
+            for mac in device_macs
+            if (command_bytes := self._build_read_request(mac, func))
+            is not None
+        ]
+        self.mqtt_client.publish_many(pairs)
 
     async def run_command(
         self, device_id: str, command: str, value=None
     ) -> bool:
         """Run a command on a device. Returns True if successful."""
         # Wait for reconnection if in progress
-        if self._reconnection_in_progress:
-            self._logger.debug(
-                "Reconnection in progress, waiting before running command..."
-            )
-            try:
-                await asyncio.wait_for(
-                    self._reconnection_event.wait(), timeout=30.0
-                )
-            except asyncio.TimeoutError:
-                self._logger.warning("Timeout waiting for reconnection")
-                return False
+        if not await self._await_reconnection(30.0):
+            return False
 
         # Ensure connected
         if not self.mqtt_client or not self.mqtt_client.connected.is_set():
             try:
-                if not await asyncio.wait_for(self.connect(), timeout=30.0):
-                    self._logger.error(
-                        "Failed to connect for command execution"
-                    )
-                    return False
+                async with asyncio.timeout(30.0):
+                    if not await self.connect():
+                        self._logger.error(
+                            "Failed to connect for command execution"
+                        )
+                        return False
             except asyncio.TimeoutError:
                 self._logger.error("Connection timeout for command execution")
                 return False
@@ -466,36 +585,45 @@ class SydpowerConnector:
                 )
                 return False
 
-        # Resolve command bytes
-        if command in COMMANDS:
-            command_bytes = COMMANDS[command]
-        elif command == "write_register" and value is not None:
-            register, reg_value = value
-            device_info = self.devices.get(device_id, {})
-            modbus_addr = device_info.get(
-                "_modbus_address", REGISTER_MODBUS_ADDRESS
-            )
-            try:
-                command_bytes = get_write_modbus(
-                    modbus_addr, register, reg_value,
+        # Resolve command bytes (single dict lookup on the hot path)
+        command_bytes = COMMANDS.get(command)
+        if command_bytes is None:
+            if command == "write_register" and value is not None:
+                register, reg_value = value
+                device_info = self.devices.get(device_id, {})
+                modbus_addr = device_info.get(
+                    "_modbus_address", REGISTER_MODBUS_ADDRESS
                 )
-            except ModbusValidationError as e:
-                self._logger.error("Refused to write: %s", e)
+                try:
+                    command_bytes = get_write_modbus(
+                        modbus_addr, register, reg_value,
+                    )
+                except ModbusValidationError as e:
+                    self._logger.error("Refused to write: %s", e)
+                    return False
+            else:
+                self._logger.error("Unknown command: %s", command)
                 return False
-        else:
-            self._logger.error("Unknown command: %s", command)
-            return False
 
         if not self.mqtt_client:
             self._logger.error("MQTT client is None")
             return False
 
         try:
+            # Give the device breathing room between consecutive
+            # commands; a lone command pays no latency tax.
+            last = self._last_command_time.get(device_id)
+            if last is not None:
+                wait = 1.0 - (self.loop.time() - last)
+                if wait > 0:
+                    await asyncio.sleep(wait)
+
             self._logger.debug("Sending command: %s", command)
-            self.mqtt_client.publish_command(device_id, command_bytes)
-            self._last_successful_communication = time.time()
-            await asyncio.sleep(1)  # Allow device to process
-            return True
+            result = await self.mqtt_client.publish_command_async(
+                device_id, command_bytes
+            )
+            self._last_command_time[device_id] = self.loop.time()
+            return result
         except Exception as e:
             self._logger.error("Error publishing command: %s", e)
             return False
@@ -504,10 +632,14 @@ class SydpowerConnector:
         """Reconnect to the API and MQTT broker (public API)."""
         return await self._handle_reconnection()
 
+    def get_last_communication_time(self) -> float:
+        """Return the monotonic loop time of the last received device data."""
+        return self.mqtt_client.last_rx_time if self.mqtt_client else 0.0
+
     async def _handle_mqtt_disconnect(self, rc):
         """Handle MQTT disconnection events."""
         self._logger.warning("MQTT disconnected with code %s", rc)
-        time_since_last = time.time() - self._last_successful_communication
+        time_since_last = self.loop.time() - self.get_last_communication_time()
 
         if time_since_last > 60:
             self._logger.warning(
@@ -517,27 +649,39 @@ class SydpowerConnector:
             )
             self._last_reconnection_attempt = 0
 
-        self.loop.create_task(self._handle_reconnection())
+        # Keep a reference so the task cannot be GC'd mid-flight, and
+        # drop duplicate triggers while one reconnection is pending
+        if self._reconnect_task and not self._reconnect_task.done():
+            self._logger.debug("Reconnection task already pending")
+            return
+        self._reconnect_task = self.loop.create_task(
+            self._handle_reconnection()
+        )
 
     async def _handle_reconnection(self):
         """Handle reconnection with proper backoff and state management."""
-        current_time = time.time()
+        if self.loop is None:
+            self.loop = asyncio.get_running_loop()
+
+        # loop.time() is monotonic, so the backoff math cannot misbehave
+        # when the wall clock jumps (NTP sync, DST)
+        current_time = self.loop.time()
 
         if (
             current_time - self._last_reconnection_attempt
             < self._min_reconnection_interval
         ):
             await asyncio.sleep(self._min_reconnection_interval)
-            current_time = time.time()
+            current_time = self.loop.time()
 
         if self._reconnection_in_progress:
             self._logger.debug(
                 "Reconnection already in progress, waiting..."
             )
             try:
-                await asyncio.wait_for(
-                    self._reconnection_event.wait(), timeout=30.0
-                )
+                if not self._reconnection_event.is_set():
+                    async with asyncio.timeout(30.0):
+                        await self._reconnection_event.wait()
             except asyncio.TimeoutError:
                 self._logger.error(
                     "Timeout waiting for existing reconnection"
@@ -545,34 +689,31 @@ class SydpowerConnector:
             return self.is_connected()
 
         try:
-            lock_acquired = await asyncio.wait_for(
-                self._connection_lock.acquire(), timeout=10.0
-            )
-        except asyncio.TimeoutError:
-            self._logger.error(
-                "Timeout acquiring connection lock for reconnection"
-            )
-            return False
-
-        if not lock_acquired:
-            return False
-
-        try:
-            self._reconnection_in_progress = True
+            # The in-progress flag (set before any await) is what keeps
+            # reconnection single-flight; holding the connection lock
+            # across the retry loop would starve connect() callers.
+            # Clear the event before raising the flag so waiters can
+            # never observe "reconnecting" with the event still set
             self._reconnection_event.clear()
+            self._reconnection_in_progress = True
             self._last_reconnection_attempt = current_time
             self._logger.info("Starting reconnection process...")
 
-            try:
-                await asyncio.wait_for(self._cleanup(), timeout=10.0)
-            except asyncio.TimeoutError:
-                self._logger.error("Cleanup timeout during reconnection")
-
-            self.api_client = None
-            self.mqtt_client = None
-            await asyncio.sleep(2)
+            # Fast path: on a transient socket drop the device list and
+            # broker credentials are still good, so try a raw broker
+            # reconnect before re-running the API lookup chain.
+            if self.mqtt_client:
+                if await self.mqtt_client.try_fast_reconnect():
+                    self._logger.info(
+                        "Reconnected via fast broker reconnect"
+                    )
+                    return True
+                # Reset the existing client instead of tearing it down —
+                # the Paho client and aiohttp session are reusable across
+                # connect attempts.
+                self.mqtt_client.reset()
 
-            max_attempts = 10
+            max_attempts = self._max_reconnection_attempts
             base_delay = 3
 
             for attempt in range(max_attempts):
@@ -580,12 +721,18 @@ class SydpowerConnector:
                     "Reconnection attempt %d/%d", attempt + 1, max_attempts
                 )
                 try:
-                    if await asyncio.wait_for(self.connect(), timeout=45.0):
+                    # First two attempts trust the broker ACK and skip
+                    # the data-request verification; later attempts run
+                    # the full check to catch half-open connections.
+                    async with asyncio.timeout(45.0):
+                        connected = await self._do_connect(
+                            verify=(attempt >= 2)
+                        )
+                    if connected:
                         self._logger.info(
                             "Successfully reconnected on attempt %d",
                             attempt + 1,
                         )
-                        self._last_successful_communication = time.time()
                         return True
                     else:
                         self._logger.warning(
@@ -603,6 +750,9 @@ class SydpowerConnector:
 
                 if attempt < max_attempts - 1:
                     delay = min(base_delay * (1.5 ** attempt), 30)
+                    # Jitter so a fleet of clients doesn't reconnect to a
+                    # shared broker in lockstep after an outage
+                    delay += random.uniform(0, delay * 0.25)
                     self._logger.warning(
                         "Waiting %.0f seconds before next reconnection attempt",
                         delay,
@@ -625,38 +775,29 @@ class SydpowerConnector:
         finally:
             self._reconnection_in_progress = False
             self._reconnection_event.set()
-            if self._connection_lock.locked():
-                self._connection_lock.release()
 
     async def _cleanup(self) -> None:
-        """Clean up resources."""
-        if self.mqtt_client:
-            try:
-                await asyncio.wait_for(
-                    self.mqtt_client.disconnect(), timeout=5.0
-                )
-            except asyncio.TimeoutError:
-                self._logger.warning("MQTT client disconnect timeout")
-            except Exception as e:
-                self._logger.warning(
-                    "Error during MQTT client cleanup: %s", e
-                )
-            finally:
-                self.mqtt_client = None
+        """Clean up resources, closing both clients concurrently."""
+        mqtt_client, self.mqtt_client = self.mqtt_client, None
+        api_client, self.api_client = self.api_client, None
 
-        if self.api_client:
+        async def _close(coro, label: str) -> None:
             try:
-                await asyncio.wait_for(
-                    self.api_client.close(), timeout=5.0
-                )
-            except asyncio.TimeoutError:
-                self._logger.warning("API client close timeout")
+                with suppress(asyncio.TimeoutError):
+                    async with asyncio.timeout(5.0):
+                        await coro
             except Exception as e:
                 self._logger.warning(
-                    "Error during API client cleanup: %s", e
+                    "Error during %s cleanup: %s", label, e
                 )
-            finally:
-                self.api_client = None
+
+        closers = []
+        if mqtt_client:
+            closers.append(_close(mqtt_client.disconnect(), "MQTT client"))
+        if api_client:
+            closers.append(_close(api_client.close(), "API client"))
+        if closers:
+            await asyncio.gather(*closers)
 
     async def disconnect(self) -> None:
         """Disconnect from the API and MQTT broker."""
@@ -666,3 +807,10 @@ class SydpowerConnector:
     def is_connected(self) -> bool:
         """Check if the connector is connected."""
         return bool(self.mqtt_client and self.mqtt_client.connected.is_set())
+
+    async def __aenter__(self) -> "SydpowerConnector":
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.disconnect()
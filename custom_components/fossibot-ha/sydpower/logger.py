@@ -2,24 +2,41 @@
 
 import logging
 import time
-from typing import Any, Dict
+from collections import OrderedDict
+from typing import Any
+
+# Max distinct status messages tracked for dedup; oldest are evicted (LRU)
+# so long-running instances don't accumulate entries forever.
+_STATUS_CACHE_SIZE = 64
 
 
 class SmartLogger:
     """Smart logging helper that deduplicates status messages and auto-enables
     verbose mode after repeated errors."""
 
+    # One instance per module; slots drop the per-instance __dict__ and
+    # make the attribute loads in debug()/error() slightly cheaper.
+    __slots__ = (
+        "_logger", "_error_count", "_last_error_time",
+        "_error_window", "_verbose_mode", "_last_status",
+    )
+
     def __init__(self, logger_name: str):
         self._logger = logging.getLogger(logger_name)
         self._error_count = 0
         self._last_error_time = 0
         self._error_window = 300  # 5 minutes
         self._verbose_mode = False
-        self._last_status: Dict[str, Any] = {}
+        self._last_status: "OrderedDict[str, Any]" = OrderedDict()
+
+    def isEnabledFor(self, level: int) -> bool:
+        """Expose the underlying level check so callers can skip building
+        expensive log arguments when the level is disabled."""
+        return self._logger.isEnabledFor(level)
 
     def _should_log_verbose(self) -> bool:
         """Determine if we should log verbose information."""
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self._last_error_time > self._error_window:
             self._error_count = 0
             self._verbose_mode = False
@@ -28,7 +45,7 @@ class SmartLogger:
     def error(self, msg: str, *args, **kwargs):
         """Log error and increase error tracking."""
         self._error_count += 1
-        self._last_error_time = time.time()
+        self._last_error_time = time.monotonic()
         if self._error_count >= 3:
             self._verbose_mode = True
         self._logger.error(msg, *args, **kwargs)
@@ -43,20 +60,32 @@ class SmartLogger:
         Regular debug calls always pass through. Status updates (is_status_update=True)
         are deduplicated unless verbose mode is active.
         """
+        if not self._logger.isEnabledFor(logging.DEBUG):
+            return
         if is_status_update and not self._should_log_verbose():
             status_key = msg
-            current_args = str(args)
+            # hash() is far cheaper than stringifying whole payloads;
+            # fall back to str() for unhashable args (lists, dicts)
+            try:
+                current_args = hash(args)
+            except TypeError:
+                current_args = str(args)
             if (status_key not in self._last_status
                     or self._last_status[status_key] != current_args):
                 self._logger.debug(msg, *args, **kwargs)
-                self._last_status[status_key] = current_args
+            self._last_status[status_key] = current_args
+            self._last_status.move_to_end(status_key)
+            if len(self._last_status) > _STATUS_CACHE_SIZE:
+                self._last_status.popitem(last=False)
         else:
             self._logger.debug(msg, *args, **kwargs)
 
     def info(self, msg: str, *args, **kwargs):
         """Log info message."""
-        self._logger.info(msg, *args, **kwargs)
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(msg, *args, **kwargs)
 
     def warning(self, msg: str, *args, **kwargs):
         """Log warning message."""
-        self._logger.warning(msg, *args, **kwargs)
+        if self._logger.isEnabledFor(logging.WARNING):
+            self._logger.warning(msg, *args, **kwargs)
@@ -8,7 +8,15 @@ MUST go through ``get_write_modbus()``, which validates against the
 WRITABLE_REGISTERS allowlist before encoding.
 """
 
-from typing import Dict, FrozenSet, List, Union
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Tuple, Union
+
+try:
+    # Rust-backed CRC — keeps checksum work off the event loop thread
+    from fastcrc import crc16 as _fastcrc16
+except ImportError:  # pragma: no cover - optional speedup
+    _fastcrc16 = None
+
 from .const import (
     REGISTER_MODBUS_ADDRESS, REGISTER_TOTAL_INPUT, REGISTER_DC_INPUT,
     REGISTER_MAXIMUM_CHARGING_CURRENT, REGISTER_USB_OUTPUT, REGISTER_DC_OUTPUT,
@@ -24,16 +32,18 @@ from .const import (
 # ---------------------------------------------------------------------------
 # Writable-register safety map
 #
-# Each entry maps a register number to a frozenset of allowed integer values.
+# Each entry maps a register number to the allowed integer values, either a
+# frozenset (sparse sets from the app) or a range (contiguous spans — O(1)
+# membership without materializing thousands of ints).
 # ``get_write_modbus()`` refuses to encode a value that is not in this set.
 #
 # Source: Fossibot BrightEMS app reverse engineering (possibleValues arrays).
 # Registers without possibleValues use bounded ranges with a safety margin.
 # ---------------------------------------------------------------------------
 
-WRITABLE_REGISTERS: Dict[int, FrozenSet[int]] = {
+WRITABLE_REGISTERS: Dict[int, Union[FrozenSet[int], range]] = {
     # Charging current: 1-20 A
-    REGISTER_MAXIMUM_CHARGING_CURRENT: frozenset(range(1, 21)),
+    REGISTER_MAXIMUM_CHARGING_CURRENT: range(1, 21),
 
     # Boolean outputs: 0 = off, 1 = on
     REGISTER_USB_OUTPUT: frozenset({0, 1}),
@@ -58,13 +68,13 @@ WRITABLE_REGISTERS: Dict[int, FrozenSet[int]] = {
     REGISTER_SLEEP_TIME: frozenset({5, 10, 30, 480}),
 
     # Stop charge after (minutes) - no possibleValues in app, allow 0-1440
-    REGISTER_STOP_CHARGE_AFTER: frozenset(range(0, 1441)),
+    REGISTER_STOP_CHARGE_AFTER: range(0, 1441),
 
     # Discharge limit (permille in register, 0-1000 → 0-100%)
-    REGISTER_DISCHARGE_LIMIT: frozenset(range(0, 1001)),
+    REGISTER_DISCHARGE_LIMIT: range(0, 1001),
 
     # Charging limit (permille in register, 0-1000 → 0-100%)
-    REGISTER_CHARGING_LIMIT: frozenset(range(0, 1001)),
+    REGISTER_CHARGING_LIMIT: range(0, 1001),
 }
 
 
@@ -76,9 +86,9 @@ class ModbusValidationError(ValueError):
 # Encoding helpers (names kept from original JS for traceability)
 # ---------------------------------------------------------------------------
 
-def int_to_high_low(value: int) -> Dict[str, int]:
-    """Convert an integer to a high/low dictionary (16-bit)."""
-    return {'low': value & 0xff, 'high': (value >> 8) & 0xff}
+def int_to_high_low(value: int) -> Tuple[int, int]:
+    """Split an integer into (high, low) bytes (16-bit)."""
+    return (value >> 8) & 0xff, value & 0xff
 
 
 def high_low_to_int(high: int, low: int) -> int:
@@ -86,64 +96,80 @@ def high_low_to_int(high: int, low: int) -> int:
     return ((high & 0xff) << 8) | (low & 0xff)
 
 
-def zi(e: int) -> Dict[str, int]:
-    """Convert integer to high/low dict (alias for int_to_high_low)."""
-    return {'low': e & 0xff, 'high': (e >> 8) & 0xff}
+def _crc16_table_entry(byte: int) -> int:
+    """Run the bit-serial CRC rounds for one input byte (table builder)."""
+    t = byte
+    for _ in range(8):
+        if t & 1:
+            t = (t >> 1) ^ 40961
+        else:
+            t >>= 1
+    return t
+
+
+# Sarwate table: one lookup per input byte instead of eight shift/XOR
+# rounds. Built once at import from the same 0xA001 polynomial, so the
+# result is bit-identical to the original loop.
+_CRC16_TABLE = tuple(_crc16_table_entry(i) for i in range(256))
 
 
 def ta(arr: List[int]) -> int:
     """CRC-16 checksum (Modbus variant)."""
+    if _fastcrc16 is not None:
+        return _fastcrc16.modbus(bytes(arr))
     t = 0xffff
+    tbl = _CRC16_TABLE
     for byte in arr:
-        t ^= byte
-        for _ in range(8):
-            if t & 1:
-                t = (t >> 1) ^ 40961
-            else:
-                t >>= 1
-    return t & 0xffff
-
-
-def sa(e: int, t: int, n: List[int], o: bool) -> List[int]:
-    """Build the command array and append the checksum."""
-    r = [e, t] + n
-    cs = zi(ta(r))
+        t = (t >> 8) ^ tbl[(t ^ byte) & 0xff]
+    return t
+
+
+def sa(e: int, t: int, n: List[int], o: bool) -> bytes:
+    """Build the command frame and append the checksum.
+
+    Fills a single preallocated bytearray in place — no intermediate
+    list concatenations — and returns the finished frame as bytes.
+    """
+    buf = bytearray(len(n) + 4)
+    buf[0] = e
+    buf[1] = t
+    buf[2:-2] = bytes(n)
+    cs = ta(memoryview(buf)[:-2])
+    hi, lo = cs >> 8, cs & 0xff
     if o:
-        r += [cs['low'], cs['high']]
+        buf[-2], buf[-1] = lo, hi
     else:
-        r += [cs['high'], cs['low']]
-    return r
+        buf[-2], buf[-1] = hi, lo
+    return bytes(buf)
 
 
-def aa(e: int, t: int, n: List[int], o: bool) -> List[int]:
+def aa(e: int, t: int, n: List[int], o: bool) -> bytes:
     """Wrap getWriteModbus: convert feature number into two bytes and build command."""
-    r = zi(t)
-    return sa(e, 6, [r['high'], r['low']] + n, o)
+    return sa(e, 6, [(t >> 8) & 0xff, t & 0xff] + n, o)
 
 
-def ia(e: int, t: int, n: int, o: bool) -> List[int]:
+def ia(e: int, t: int, n: int, o: bool) -> bytes:
     """Wrap getReadModbus: prepare a read holding registers command (func 03)."""
-    r = zi(t)
-    i_val = n & 0xff
-    a_val = n >> 8
-    return sa(e, 3, [r['high'], r['low'], a_val, i_val], o)
+    return sa(e, 3, [(t >> 8) & 0xff, t & 0xff, n >> 8, n & 0xff], o)
 
 
-def ia_input(e: int, t: int, n: int, o: bool) -> List[int]:
+def ia_input(e: int, t: int, n: int, o: bool) -> bytes:
     """Wrap getReadInputModbus: read input registers command (func 04)."""
-    r = zi(t)
-    i_val = n & 0xff
-    a_val = n >> 8
-    return sa(e, 4, [r['high'], r['low'], a_val, i_val], o)
+    return sa(e, 4, [(t >> 8) & 0xff, t & 0xff, n >> 8, n & 0xff], o)
 
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
-def get_write_modbus(address: int, feature: int, value: int) -> List[int]:
+@lru_cache(maxsize=256)
+def get_write_modbus(address: int, feature: int, value: int) -> bytes:
     """Encode a validated Modbus write command.
 
+    Pure in its (small-cardinality) integer arguments, so results are
+    memoized — repeat service calls skip validation, CRC, and encoding.
+    The cached value is immutable ``bytes``.
+
     Raises ModbusValidationError if the register is unknown or the value
     is not in the allowed set.
     """
@@ -157,19 +183,23 @@ def get_write_modbus(address: int, feature: int, value: int) -> List[int]:
             "Value %d is not allowed for register %d. Allowed: %s"
             % (value, feature, _format_allowed(allowed))
         )
-    a = int_to_high_low(value)
-    return aa(address, feature, [a['high'], a['low']], False)
+    high, low = int_to_high_low(value)
+    return aa(address, feature, [high, low], False)
 
 
-def get_read_modbus(address: int, count: int) -> List[int]:
+@lru_cache(maxsize=64)
+def get_read_modbus(address: int, count: int) -> bytes:
     """Encode a Modbus read holding registers command (function code 03).
 
-    Returns settings data on the ``client/data`` MQTT topic.
+    Returns settings data on the ``client/data`` MQTT topic. Memoized:
+    polls reuse a handful of (address, count) pairs for the process
+    lifetime, so repeat calls are a single cache hit.
     """
     return ia(address, 0, count, False)
 
 
-def get_read_input_modbus(address: int, count: int) -> List[int]:
+@lru_cache(maxsize=64)
+def get_read_input_modbus(address: int, count: int) -> bytes:
     """Encode a Modbus read input registers command (function code 04).
 
     Returns sensor data (SoC, power, outputs) on the ``client/04`` topic.
@@ -177,8 +207,12 @@ def get_read_input_modbus(address: int, count: int) -> List[int]:
     return ia_input(address, 0, count, False)
 
 
-def _format_allowed(allowed: FrozenSet[int]) -> str:
+def _format_allowed(allowed: Union[FrozenSet[int], range]) -> str:
     """Format an allowed-values set for error messages."""
+    if isinstance(allowed, range):
+        return "{%d..%d} (%d values)" % (
+            allowed.start, allowed.stop - 1, len(allowed)
+        )
     if len(allowed) <= 20:
         return "{%s}" % ", ".join(str(v) for v in sorted(allowed))
     lo, hi = min(allowed), max(allowed)
@@ -187,6 +221,9 @@ def _format_allowed(allowed: FrozenSet[int]) -> str:
 
 # ---------------------------------------------------------------------------
 # Pre-defined commands (validated at import time)
+#
+# Frozen as ``bytes`` so they can be handed to the MQTT transport without
+# a per-publish list→bytes copy, and cannot be mutated by callers.
 # ---------------------------------------------------------------------------
 
 REGRequestSettings      = get_read_modbus(REGISTER_MODBUS_ADDRESS, 80)
@@ -209,63 +246,87 @@ REGEnableACSilentChg    = get_write_modbus(REGISTER_MODBUS_ADDRESS, REGISTER_AC_
 # Register parsing
 # ---------------------------------------------------------------------------
 
+# Response-topic suffixes. Topics arrive as "{mac}/device/response/...",
+# so dispatch is a short suffix compare rather than a substring scan of
+# the whole topic.
+TOPIC_SENSORS_SUFFIX = "device/response/client/04"
+TOPIC_SETTINGS_SUFFIX = "device/response/client/data"
+
+# Output-state nibble → (usb, dc, ac, led). Register 41 packs the four
+# output flags into bits 9-12; one shift and a table lookup unpacks them.
+_OUTPUT_BITS = tuple(
+    (bool(n & 1), bool(n & 2), bool(n & 4), bool(n & 8)) for n in range(16)
+)
+
+
+def _parse_sensor_registers(registers: List[int]) -> Dict[str, Union[int, float, bool]]:
+    """Parse a full sensor response (".../client/04")."""
+    # Register 41 is the active-outputs bitfield
+    usb, dc, ac, led = _OUTPUT_BITS[(registers[41] >> 9) & 0xF]
+
+    device_update = {
+        # Registers hold permille; /10 gives percent with exactly
+        # one decimal, so no round() is needed
+        "soc": registers[56] / 10,
+        "dcInput": registers[4],
+        "totalInput": registers[6],
+        "totalOutput": registers[39],
+        "acOutputVoltage": (registers[18] / 10),
+        "acOutputFrequency": (registers[19] / 10),
+        "acInputVoltage": (registers[21] / 10),
+        "acInputFrequency": (registers[22] / 100),
+
+        "usbOutput": usb,   # bit 9
+        "dcOutput": dc,     # bit 10
+        "acOutput": ac,     # bit 11
+        "ledOutput": led,   # bit 12
+    }
+    if registers[53] > 0:
+        device_update["soc_s1"] = (registers[53] - 10) / 10
+    if registers[55] > 0:
+        device_update["soc_s2"] = (registers[55] - 10) / 10
+    return device_update
+
+
+def _parse_settings_registers(registers: List[int]) -> Dict[str, Union[int, float, bool]]:
+    """Parse a settings response (".../client/data")."""
+    return {
+        "acChargingRate": registers[13],
+        "maximumChargingCurrent": registers[20],
+        "acSilentCharging": (registers[57] == 1),
+        "usbStandbyTime": registers[59],
+        "acStandbyTime": registers[60],
+        "dcStandbyTime": registers[61],
+        "screenRestTime": registers[62],
+        "stopChargeAfter": registers[63],
+        "dischargeLowerLimit": (registers[66] / 10),
+        "acChargingUpperLimit": (registers[67] / 10),
+        "wholeMachineUnusedTime": registers[68],
+    }
+
+
+# Dispatch by the topic's last path segment — one dict lookup instead of
+# suffix scans per message.
+_TOPIC_PARSERS = {
+    TOPIC_SENSORS_SUFFIX.rsplit("/", 1)[-1]: _parse_sensor_registers,
+    TOPIC_SETTINGS_SUFFIX.rsplit("/", 1)[-1]: _parse_settings_registers,
+}
+
+
 def parse_registers(registers: List[int], topic: str) -> Dict[str, Union[int, float, bool]]:
     """Parse device registers based on topic and return structured data."""
-    device_update = {}
-
     if len(registers) == 81:
-        if 'device/response/client/04' in topic:
-            # Get register 41 value (active outputs list)
-            register_value = registers[41]
-
-            # Replicate the JavaScript logic exactly
-            # ("0000000000000000" + e[41].toString(2).padStart(8, "0")).slice(-16)
-            binary_str = format(register_value, '016b')
-
-            device_update.update({
-                "soc": round(registers[56] / 1000 * 100, 1),
-                "dcInput": registers[4],
-                "totalInput": registers[6],
-                "totalOutput": registers[39],
-                "acOutputVoltage": (registers[18] / 10),
-                "acOutputFrequency": (registers[19] / 10),
-                "acInputVoltage": (registers[21] / 10),
-                "acInputFrequency": (registers[22] / 100),
-
-                # Direct string indexing matches JS array indexing after split
-                "usbOutput": binary_str[6] == '1',   # Position 6: USB Output
-                "dcOutput": binary_str[5] == '1',     # Position 5: DC Output
-                "acOutput": binary_str[4] == '1',     # Position 4: AC Output
-                "ledOutput": binary_str[3] == '1',    # Position 3: LED Output
-            })
-            if registers[53] > 0:
-                device_update.update({
-                    "soc_s1": round(registers[53] / 1000 * 100 - 1, 1),
-                })
-            if registers[55] > 0:
-                device_update.update({
-                    "soc_s2": round(registers[55] / 1000 * 100 - 1, 1),
-                })
-        elif 'device/response/client/data' in topic:
-            device_update.update({
-                "acChargingRate": registers[13],
-                "maximumChargingCurrent": registers[20],
-                "acSilentCharging": (registers[57] == 1),
-                "usbStandbyTime": registers[59],
-                "acStandbyTime": registers[60],
-                "dcStandbyTime": registers[61],
-                "screenRestTime": registers[62],
-                "stopChargeAfter": registers[63],
-                "dischargeLowerLimit": (registers[66] / 10),
-                "acChargingUpperLimit": (registers[67] / 10),
-                "wholeMachineUnusedTime": registers[68]
-            })
-    elif len(registers) >= 57:
+        parser = _TOPIC_PARSERS.get(topic.rsplit("/", 1)[-1])
+        if parser is None:
+            return {}
+        return parser(registers)
+
+    device_update: Dict[str, Union[int, float, bool]] = {}
+    if len(registers) >= 57:
         # Partial update with just SOC
-        device_update["soc"] = round(registers[56] / 1000 * 100, 1)
+        device_update["soc"] = registers[56] / 10
         if registers[53] > 0:
-            device_update["soc_s1"] = round(registers[53] / 1000 * 100 - 1, 1)
+            device_update["soc_s1"] = (registers[53] - 10) / 10
         if registers[55] > 0:
-            device_update["soc_s2"] = round(registers[55] / 1000 * 100 - 1, 1)
-
+            device_update["soc_s2"] = (registers[55] - 10) / 10
     return device_update
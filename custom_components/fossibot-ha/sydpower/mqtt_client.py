@@ -2,16 +2,27 @@
 """MQTT client for Fossibot devices via local MQTT broker."""
 
 import asyncio
+import logging
+import secrets
+import struct
 import time
-import random
 import threading
 from typing import Any, Callable, Coroutine, Dict, List, Optional
 
+from collections import OrderedDict
+
 import paho.mqtt.client as mqtt
 
 from .const import DEFAULT_MQTT_PORT
 from .logger import SmartLogger
-from .modbus import REGRequestSettings, parse_registers, high_low_to_int
+from .modbus import (
+    REGRequestSettings, parse_registers,
+    TOPIC_SENSORS_SUFFIX, TOPIC_SETTINGS_SUFFIX,
+)
+
+# Compiled big-endian u16-array decoders keyed by register count; frames
+# come in a couple of fixed sizes, so each format is parsed exactly once.
+_STRUCT_CACHE: Dict[int, struct.Struct] = {}
 
 CONNECTION_CODES = {
     0: "Connection successful",
@@ -29,24 +40,44 @@ class MQTTClient:
     def __init__(self, loop: asyncio.AbstractEventLoop):
         self.mqtt_client: Optional[mqtt.Client] = None
         self.connected = asyncio.Event()
-        self.data_updated = asyncio.Event()
+        self.retained_seen = asyncio.Event()
+
+        # Monotonically increasing count of applied data frames. The
+        # connector snapshots it to tell "new data arrived" from "still
+        # waiting" across its poll timeouts.
+        self.data_seq: int = 0
+
+        # Per-poll completion tracking: devices we still expect a
+        # response from, and an event set once they have all reported.
+        self.pending_devices: set = set()
+        self.all_devices_reported = asyncio.Event()
         self.loop = loop
         self._logger = SmartLogger(__name__)
 
-        # Device data
+        # Device data. Only mutated by the parser worker on the event
+        # loop, so no lock is needed around the dict updates.
         self.devices: Dict[str, Any] = {}
-        self._device_data_lock = asyncio.Lock()
 
-        # Message deduplication
-        self._message_cache: Dict[str, float] = {}
+        # Message deduplication. Insertion order equals arrival order, so
+        # expired entries are always at the front — eviction is O(1) per
+        # message instead of a periodic full-dict sweep under the lock.
+        self._message_cache: "OrderedDict[tuple, float]" = OrderedDict()
         self._message_cache_ttl = 2
-        self._last_cache_cleanup = 0
-        self._message_cache_lock = threading.RLock()
+        self._message_cache_max = 4096
+        # Plain Lock: nothing re-enters while holding it, and it skips
+        # RLock's owner bookkeeping on every message
+        self._message_cache_lock = threading.Lock()
 
-        # State tracking
-        self._last_successful_communication = time.time()
+        # State tracking (monotonic loop time of the last received device data)
+        self.last_rx_time: float = 0.0
         self._is_disconnecting = False
-        self._subscribed_topics: List[str] = []
+        # Set when the broker rejects our client id (rc=2) so the next
+        # connect builds a fresh client with a new id
+        self._rebuild_client = False
+
+        # Subscription batch, built once per device set so reconnect
+        # storms don't re-run the topic string formatting
+        self._subscribe_batch: List[tuple] = []
 
         # Device online/offline state
         self._device_online: Dict[str, bool] = {}
@@ -54,6 +85,26 @@ class MQTTClient:
         # Custom message handlers
         self._message_handlers: Dict[str, Callable[[str, List[int]], Coroutine]] = {}
 
+        # Futures awaiting broker PUBACK, keyed by paho message id
+        self._pending_publishes: Dict[int, asyncio.Future] = {}
+
+        # Hand-off from the paho network thread to the event loop: the
+        # callback only dedups and enqueues, so it never blocks broker
+        # keepalives behind register parsing. Bounded — bursts drop the
+        # oldest frame rather than growing without limit.
+        self._rx_queue: Optional[asyncio.Queue] = None
+        self._parser_task: Optional[asyncio.Task] = None
+
+        # Disconnect signalling: one long-lived watcher awaits the event
+        # and runs the callback, so bursts of disconnects coalesce into a
+        # single notification instead of spawning a task per event.
+        self._disconnect_event = asyncio.Event()
+        self._pending_rc: int = 0
+        self._disconnect_watcher: Optional[asyncio.Task] = None
+
+        # Request-topic strings per device, built once at connect time
+        self._req_topics: Dict[str, str] = {}
+
         # Callbacks
         self.on_disconnect_callback: Optional[Callable] = None
         self.on_device_state_callback: Optional[Callable] = None
@@ -72,29 +123,64 @@ class MQTTClient:
             )
             self._is_disconnecting = False
             self.connected.clear()
+            self.retained_seen.clear()
 
-            hex_string = "".join(
-                random.choice("0123456789abcdef") for _ in range(24)
-            )
-            timestamp_ms = int(time.time() * 1000)
-            client_id = f"fossibot_ha_{hex_string}_{timestamp_ms}"
-
-            self.mqtt_client = mqtt.Client(
-                client_id=client_id,
-                clean_session=True,
-                transport="tcp",
-                protocol=mqtt.MQTTv311,
-            )
+            if self._rx_queue is None:
+                self._rx_queue = asyncio.Queue(maxsize=512)
+            if self._parser_task is None or self._parser_task.done():
+                self._parser_task = self.loop.create_task(
+                    self._parser_worker()
+                )
+            if (
+                self._disconnect_watcher is None
+                or self._disconnect_watcher.done()
+            ):
+                self._disconnect_watcher = self.loop.create_task(
+                    self._disconnect_watcher_coro()
+                )
+
+            # Build the paho client once and reuse it across reconnects —
+            # rebuilding allocates fresh queues and state machines for no
+            # benefit. Rebuild only if the broker rejected our client id.
+            if self.mqtt_client is None or self._rebuild_client:
+                timestamp_ms = int(time.time() * 1000)
+                client_id = f"fossibot_ha_{secrets.token_hex(12)}_{timestamp_ms}"
+
+                self.mqtt_client = mqtt.Client(
+                    client_id=client_id,
+                    clean_session=True,
+                    transport="tcp",
+                    protocol=mqtt.MQTTv311,
+                )
 
-            # Username auth only — password not required per SYDPOWER docs
-            if mqtt_username:
-                self.mqtt_client.username_pw_set(username=mqtt_username)
+                # Username auth only — password not required per SYDPOWER docs
+                if mqtt_username:
+                    self.mqtt_client.username_pw_set(username=mqtt_username)
 
-            self.mqtt_client.on_connect = self._on_connect
-            self.mqtt_client.on_message = self._on_message
-            self.mqtt_client.on_disconnect = self._on_disconnect
+                # Bound the backoff of paho's own network-thread
+                # reconnect attempts between explicit reconnects
+                self.mqtt_client.reconnect_delay_set(
+                    min_delay=1, max_delay=30
+                )
+                self.mqtt_client.on_connect = self._on_connect
+                self.mqtt_client.on_message = self._on_message
+                self.mqtt_client.on_disconnect = self._on_disconnect
+                self.mqtt_client.on_publish = self._on_publish
+                self._rebuild_client = False
 
             self._device_ids = device_ids
+            self._req_topics = {
+                device_id: f"{device_id}/client/request/data"
+                for device_id in device_ids
+            }
+            self._subscribe_batch = [
+                (f"{device_mac}/device/response/{suffix}", 1)
+                for device_mac in device_ids
+                for suffix in ("state", "client/+")
+            ]
+            # The on-connect handler requests data from every device, so
+            # arm completion tracking for those initial responses too.
+            self.expect_responses(device_ids)
 
             self.mqtt_client.connect(mqtt_host, mqtt_port, keepalive=30)
             self.mqtt_client.loop_start()
@@ -126,35 +212,24 @@ class MQTTClient:
                 "MQTT connection refused: %s",
                 CONNECTION_CODES.get(rc, "Unknown error"),
             )
+            if rc == 2:  # invalid client identifier — regenerate next time
+                self._rebuild_client = True
             return
 
-        # Unsubscribe from any prior topics
-        for topic in self._subscribed_topics:
-            client.unsubscribe(topic)
-        self._subscribed_topics = []
-
-        subscribe_topics = []
-        for device_mac in self._device_ids:
-            topics = [
-                (f"{device_mac}/device/response/state", 1),
-                (f"{device_mac}/device/response/client/+", 1),
-            ]
-            for topic, qos in topics:
-                subscribe_topics.append((topic, qos))
-                self._subscribed_topics.append(topic)
-
-        if not subscribe_topics:
+        # Prior subscriptions are dropped by the broker on disconnect
+        # (clean_session=True), so no unsubscribe pass is needed.
+        if not self._subscribe_batch:
             self._logger.error("No devices found to subscribe to")
             return
 
-        client.subscribe(subscribe_topics)
-        self._logger.debug("Subscribed to %d topics", len(subscribe_topics))
+        client.subscribe(self._subscribe_batch)
+        self._logger.debug(
+            "Subscribed to %d topics", len(self._subscribe_batch)
+        )
 
         for device_mac in self._device_ids:
             client.publish(
-                f"{device_mac}/client/request/data",
-                bytes(REGRequestSettings),
-                qos=1,
+                self._req_topics[device_mac], REGRequestSettings, qos=1
             )
             self._logger.debug(
                 "Published func 03 request to %s on connect", device_mac
@@ -168,81 +243,125 @@ class MQTTClient:
             topic = msg.topic
             payload = msg.payload
 
+            # Retained messages mean the broker replayed the last known
+            # device state on subscribe — good enough for verification.
+            if msg.retain and not self.retained_seen.is_set():
+                self.loop.call_soon_threadsafe(self.retained_seen.set)
+
+            # One split serves the whole handler: the MAC prefix and the
+            # fixed response path (tuple-returning partition, no list)
+            device_mac, _, response_path = topic.partition("/")
+
             # Handle device connection state messages (1 = online, 0 = offline)
-            if topic.endswith("/device/response/state"):
-                self._handle_state_message(topic, payload)
+            if response_path == "device/response/state":
+                self._handle_state_message(device_mac, payload)
                 return
 
-            payload_list = list(payload)
-
-            # Deduplication
-            message_id = f"{topic}:{hash(bytes(payload_list))}"
+            # Deduplication. Payloads are short (<200 bytes), so keying
+            # on the bytes themselves is exact — no hash collisions.
+            message_id = (topic, payload)
             current_time = time.time()
 
             with self._message_cache_lock:
-                if current_time - self._last_cache_cleanup > 30:
-                    expired = [
-                        k
-                        for k, v in self._message_cache.items()
-                        if current_time - v > self._message_cache_ttl
-                    ]
-                    for key in expired:
-                        del self._message_cache[key]
-                    self._last_cache_cleanup = current_time
-
-                if message_id in self._message_cache:
-                    age = current_time - self._message_cache[message_id]
+                cache = self._message_cache
+                # Oldest entries are at the front; evict until fresh
+                while cache:
+                    oldest = next(iter(cache.values()))
+                    if current_time - oldest <= self._message_cache_ttl:
+                        break
+                    cache.popitem(last=False)
+
+                if message_id in cache:
+                    age = current_time - cache[message_id]
                     self._logger.debug(
                         "Dedup: dropping duplicate on %s (%.1fs old)",
-                        topic.split("/", 1)[1] if "/" in topic else topic,
+                        response_path or topic,
                         age,
                     )
                     return
-                self._message_cache[message_id] = current_time
+                cache[message_id] = current_time
+                if len(cache) > self._message_cache_max:
+                    cache.popitem(last=False)
 
             # Filter short/invalid messages
-            if len(payload_list) < 8:
+            if len(payload) < 8:
                 return
 
-            data_bytes = payload_list[6:]
-
-            if len(data_bytes) % 2 != 0:
-                self._logger.warning("Odd byte count in payload from %s", topic)
-                return
+            # Decoding and parsing happen on the event loop; the paho
+            # thread returns immediately so broker keepalives and acks
+            # are never starved behind register parsing.
+            self.loop.call_soon_threadsafe(
+                self._enqueue_message, device_mac, topic, payload
+            )
 
-            registers = [
-                high_low_to_int(data_bytes[i], data_bytes[i + 1])
-                for i in range(0, len(data_bytes), 2)
-            ]
+        except Exception as e:
+            self._logger.error("Error processing MQTT message: %s", e)
 
-            if len(registers) < 57:
-                # Short responses (e.g. 1 register) are normal write ACKs
-                self._logger.debug(
-                    "Short response (%d registers) from %s — likely write ACK",
-                    len(registers), topic,
-                )
-                return
+    def _enqueue_message(self, device_mac: str, topic: str, payload: bytes):
+        """Queue a raw frame for the parser worker (runs on the loop)."""
+        queue = self._rx_queue
+        if queue is None:
+            return
+        if queue.full():
+            # Back-pressure: drop the oldest frame, keep the newest
+            try:
+                queue.get_nowait()
+            except asyncio.QueueEmpty:
+                pass
+        queue.put_nowait((device_mac, topic, payload))
+
+    async def _parser_worker(self):
+        """Decode and apply queued frames, one at a time, on the loop."""
+        while True:
+            device_mac, topic, payload = await self._rx_queue.get()
+            try:
+                await self._process_frame(device_mac, topic, payload)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._logger.error("Error parsing MQTT frame: %s", e)
 
-            device_mac = topic.split("/")[0]
+    async def _process_frame(self, device_mac: str, topic: str, payload: bytes):
+        """Decode registers from a raw frame and apply the update."""
+        if (len(payload) - 6) % 2 != 0:
+            self._logger.warning("Odd byte count in payload from %s", topic)
+            return
 
-            if device_mac in self._message_handlers:
-                asyncio.run_coroutine_threadsafe(
-                    self._message_handlers[device_mac](topic, registers),
-                    self.loop,
-                )
-                return
+        # Decode all big-endian 16-bit registers in one C call
+        # instead of a Python loop over byte pairs
+        reg_count = (len(payload) - 6) // 2
+        decoder = _STRUCT_CACHE.get(reg_count)
+        if decoder is None:
+            decoder = _STRUCT_CACHE[reg_count] = struct.Struct(
+                ">%dH" % reg_count
+            )
+        registers = list(decoder.unpack_from(payload, 6))
 
-            device_update = parse_registers(registers, topic)
+        if len(registers) < 57:
+            # Short responses (e.g. 1 register) are normal write ACKs
+            self._logger.debug(
+                "Short response (%d registers) from %s — likely write ACK",
+                len(registers), topic,
+            )
+            return
 
-            # Determine topic type for logging
-            if "client/04" in topic:
-                topic_tag = "sensors"
-            elif "client/data" in topic:
-                topic_tag = "settings"
-            else:
-                topic_tag = "other"
+        handler = self._message_handlers.get(device_mac)
+        if handler is not None:
+            await handler(topic, registers)
+            return
 
-            if device_update:
+        device_update = parse_registers(registers, topic)
+
+        if device_update:
+            # The topic tag and sorted key list exist only for this log
+            # line — don't compute them when debug logging is off
+            if self._logger.isEnabledFor(logging.DEBUG):
+                if topic.endswith(TOPIC_SENSORS_SUFFIX):
+                    topic_tag = "sensors"
+                elif topic.endswith(TOPIC_SETTINGS_SUFFIX):
+                    topic_tag = "settings"
+                else:
+                    topic_tag = "other"
                 self._logger.debug(
                     "Device %s [%s]: %d fields — %s",
                     device_mac,
@@ -250,26 +369,18 @@ class MQTTClient:
                     len(device_update),
                     sorted(device_update.keys()),
                 )
-                asyncio.run_coroutine_threadsafe(
-                    self._update_device_data(device_mac, device_update),
-                    self.loop,
-                )
-            else:
-                self._logger.warning(
-                    "No data extracted from message on %s", topic
-                )
-
-        except Exception as e:
-            self._logger.error("Error processing MQTT message: %s", e)
+            await self._update_device_data(device_mac, device_update)
+        else:
+            self._logger.warning(
+                "No data extracted from message on %s", topic
+            )
 
-    def _handle_state_message(self, topic: str, payload: bytes):
+    def _handle_state_message(self, device_mac: str, payload: bytes):
         """Handle device online/offline state messages.
 
         The device publishes '1' (online) or '0' (offline) to
         {MAC}/device/response/state.
         """
-        device_mac = topic.split("/")[0]
-
         try:
             state_str = payload.decode("utf-8").strip()
         except (UnicodeDecodeError, AttributeError):
@@ -299,18 +410,20 @@ class MQTTClient:
         return self._device_online.get(device_mac, False)
 
     async def _update_device_data(self, device_mac, device_update):
-        """Update device data safely."""
-        async with self._device_data_lock:
-            if device_mac not in self.devices:
-                self.devices[device_mac] = {}
-            self.devices[device_mac].update(device_update)
-            self._last_successful_communication = time.time()
-            self.data_updated.set()
-            self._logger.debug(
-                "Device %s total: %d fields accumulated",
-                device_mac,
-                len(self.devices[device_mac]),
-            )
+        """Apply a parsed update (runs only in the parser worker)."""
+        if device_mac not in self.devices:
+            self.devices[device_mac] = {}
+        self.devices[device_mac].update(device_update)
+        self.last_rx_time = self.loop.time()
+        self.data_seq += 1
+        self.pending_devices.discard(device_mac)
+        if not self.pending_devices:
+            self.all_devices_reported.set()
+        self._logger.debug(
+            "Device %s total: %d fields accumulated",
+            device_mac,
+            len(self.devices[device_mac]),
+        )
 
     def _on_disconnect(self, client, userdata, rc):
         """Handle MQTT disconnection."""
@@ -323,32 +436,114 @@ class MQTTClient:
 
         if rc != 0:
             self._logger.warning("Unexpected MQTT disconnection (code %s)", rc)
+            self._pending_rc = rc
+            self.loop.call_soon_threadsafe(self._disconnect_event.set)
+
+    async def _disconnect_watcher_coro(self):
+        """Run the disconnect callback for each (coalesced) disconnect."""
+        while True:
+            await self._disconnect_event.wait()
+            self._disconnect_event.clear()
+            if self.on_disconnect_callback:
+                try:
+                    await self.on_disconnect_callback(self._pending_rc)
+                except Exception as e:
+                    self._logger.error("Error in disconnect callback: %s", e)
+
+    def _on_publish(self, client, userdata, mid):
+        """Resolve the future waiting on this message's broker PUBACK."""
+        future = self._pending_publishes.pop(mid, None)
+        if future is not None:
             self.loop.call_soon_threadsafe(
-                lambda: asyncio.create_task(
-                    self._handle_disconnect_callback(rc)
-                )
+                lambda f=future: f.done() or f.set_result(True)
             )
 
-    async def _handle_disconnect_callback(self, rc):
-        """Handle disconnect callback in async context."""
-        if self.on_disconnect_callback:
-            try:
-                await self.on_disconnect_callback(rc)
-            except Exception as e:
-                self._logger.error("Error in disconnect callback: %s", e)
+    async def publish_command_async(
+        self, device_id: str, command: bytes, timeout: float = 2.0
+    ) -> bool:
+        """Publish a command and wait for the broker's QoS 1 PUBACK.
 
-    def publish_command(self, device_id: str, command: List[int]) -> None:
+        Returns as soon as the broker acknowledges (typically tens of
+        milliseconds) instead of a fixed post-publish delay. A missing
+        ack within the timeout is logged but not treated as failure —
+        the message is usually still delivered.
+        """
+        if not self.mqtt_client or not self.mqtt_client.is_connected():
+            self._logger.error("Cannot send command: MQTT not connected")
+            return False
+
+        try:
+            topic = self._request_topic(device_id)
+            info = self.mqtt_client.publish(topic, command, qos=1)
+        except Exception as e:
+            self._logger.error("Error publishing command: %s", e)
+            return False
+
+        if info.is_published():
+            return True
+
+        future = self.loop.create_future()
+        self._pending_publishes[info.mid] = future
+
+        # The paho thread may have acked between publish and registration
+        if info.is_published():
+            self._pending_publishes.pop(info.mid, None)
+            return True
+
+        try:
+            async with asyncio.timeout(timeout):
+                await future
+        except asyncio.TimeoutError:
+            self._pending_publishes.pop(info.mid, None)
+            self._logger.debug(
+                "No PUBACK for mid %s within %.1fs", info.mid, timeout
+            )
+        return True
+
+    def publish_command(self, device_id: str, command: bytes) -> None:
         """Publish a command to a device."""
         if not self.mqtt_client or not self.mqtt_client.is_connected():
             self._logger.error("Cannot send command: MQTT not connected")
             return
 
         try:
-            topic = f"{device_id}/client/request/data"
-            self.mqtt_client.publish(topic, bytes(command), qos=1)
+            topic = self._request_topic(device_id)
+            self.mqtt_client.publish(topic, command, qos=1)
         except Exception as e:
             self._logger.error("Error publishing command: %s", e)
 
+    def _request_topic(self, device_id: str) -> str:
+        """Return the cached request topic for a device."""
+        topic = self._req_topics.get(device_id)
+        if topic is None:
+            topic = f"{device_id}/client/request/data"
+            self._req_topics[device_id] = topic
+        return topic
+
+    def expect_responses(self, device_ids) -> None:
+        """Arm per-device completion tracking for the next poll."""
+        self.pending_devices = set(device_ids)
+        self.all_devices_reported.clear()
+
+    def publish_many(self, pairs: List[tuple]) -> None:
+        """Publish pre-built commands to several devices in one pass.
+
+        Takes (device_id, command_bytes) tuples so command construction
+        stays out of the publish loop.
+        """
+        if not self.mqtt_client or not self.mqtt_client.is_connected():
+            self._logger.error("Cannot send commands: MQTT not connected")
+            return
+
+        for device_id, command in pairs:
+            try:
+                topic = self._request_topic(device_id)
+                self.mqtt_client.publish(topic, command, qos=1)
+            except Exception as e:
+                self._logger.error(
+                    "Error publishing command to %s: %s", device_id, e
+                )
+
     def register_message_handler(
         self, device_id: str, handler: Callable
     ) -> None:
@@ -364,13 +559,66 @@ class MQTTClient:
         """Request a data update from a device."""
         self.publish_command(device_id, REGRequestSettings)
 
+    async def try_fast_reconnect(self, timeout: float = 10.0) -> bool:
+        """Attempt a raw broker reconnect on the existing paho client.
+
+        A transient socket drop invalidates neither the credentials nor
+        the precomputed subscribe batch, so a plain MQTT reconnect (the
+        on-connect handler replays subscriptions and data requests) is
+        enough — no API round-trip. Returns False so callers can fall
+        back to the full connect chain.
+        """
+        if self.mqtt_client is None or self._rebuild_client:
+            return False
+        self._is_disconnecting = False
+        self.connected.clear()
+        try:
+            # reconnect() does blocking socket I/O — keep it off the loop
+            await self.loop.run_in_executor(None, self.mqtt_client.reconnect)
+            async with asyncio.timeout(timeout):
+                await self.connected.wait()
+            return True
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._logger.debug("Fast reconnect failed: %s", e)
+            return False
+
+    def reset(self) -> None:
+        """Reset connection state for a fresh connect attempt.
+
+        Unlike disconnect(), this keeps the instance (and its wiring of
+        callbacks) reusable, so reconnection does not have to rebuild
+        and rewire a new MQTTClient.
+        """
+        self._is_disconnecting = True
+        try:
+            if self.mqtt_client:
+                self.mqtt_client.loop_stop()
+                self.mqtt_client.disconnect()
+        except Exception as e:
+            self._logger.debug("Error stopping MQTT client on reset: %s", e)
+        finally:
+            self.connected.clear()
+            self.retained_seen.clear()
+            self.all_devices_reported.clear()
+            self.pending_devices.clear()
+            self.devices.clear()
+            self.clear_message_cache()
+            self._is_disconnecting = False
+
     async def disconnect(self) -> None:
         """Disconnect from the MQTT broker."""
+        if self._parser_task is not None:
+            self._parser_task.cancel()
+            self._parser_task = None
+        if self._disconnect_watcher is not None:
+            self._disconnect_watcher.cancel()
+            self._disconnect_watcher = None
         if self.mqtt_client:
             try:
                 self._is_disconnecting = True
                 self.connected.clear()
-                self.data_updated.clear()
                 self.mqtt_client.loop_stop()
                 self.mqtt_client.disconnect()
                 self._logger.debug("MQTT client disconnected")
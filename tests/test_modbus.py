@@ -9,7 +9,6 @@ import pytest
 from fossibot_ha.sydpower.modbus import (
     int_to_high_low,
     high_low_to_int,
-    zi,
     ta,
     sa,
     aa,
@@ -64,29 +63,21 @@ class TestHighLow:
     """Test 16-bit high/low byte conversion."""
 
     def test_zero(self):
-        result = int_to_high_low(0)
-        assert result == {"low": 0, "high": 0}
+        assert int_to_high_low(0) == (0, 0)
 
     def test_255(self):
-        result = int_to_high_low(255)
-        assert result == {"low": 255, "high": 0}
+        assert int_to_high_low(255) == (0, 255)
 
     def test_256(self):
-        result = int_to_high_low(256)
-        assert result == {"low": 0, "high": 1}
+        assert int_to_high_low(256) == (1, 0)
 
     def test_0xABCD(self):
-        result = int_to_high_low(0xABCD)
-        assert result == {"low": 0xCD, "high": 0xAB}
+        assert int_to_high_low(0xABCD) == (0xAB, 0xCD)
 
     def test_round_trip(self):
         for val in [0, 1, 127, 255, 256, 1000, 0xFFFF]:
-            hl = int_to_high_low(val)
-            assert high_low_to_int(hl["high"], hl["low"]) == val
-
-    def test_zi_matches_int_to_high_low(self):
-        for val in [0, 42, 1000, 0xFFFF]:
-            assert zi(val) == int_to_high_low(val)
+            high, low = int_to_high_low(val)
+            assert high_low_to_int(high, low) == val
 
 
 # ---------------------------------------------------------------------------
@@ -177,7 +168,8 @@ class TestCommandBuilding:
 class TestPredefinedCommands:
     """Verify pre-defined commands are valid byte arrays."""
 
-    def test_all_predefined_are_lists(self):
+    def test_all_predefined_are_bytes(self):
+        """Constants are frozen bytes — publishable as-is and immutable."""
         for cmd in [
             REGRequestSettings, REGRequestSensors,
             REGDisableUSBOutput, REGEnableUSBOutput,
@@ -186,8 +178,7 @@ class TestPredefinedCommands:
             REGEnableLEDSOS, REGEnableLEDFlash, REGDisableACSilentChg,
             REGEnableACSilentChg,
         ]:
-            assert isinstance(cmd, list)
-            assert all(isinstance(b, int) for b in cmd)
+            assert isinstance(cmd, bytes)
             assert all(0 <= b <= 255 for b in cmd)
 
     def test_write_commands_length(self):
@@ -261,12 +252,19 @@ class TestWritableRegisters:
         }
         assert expected == set(WRITABLE_REGISTERS.keys())
 
-    def test_all_values_are_frozensets(self):
+    def test_all_values_are_frozensets_or_ranges(self):
+        """Sparse sets use frozenset; contiguous spans use range."""
         for reg, allowed in WRITABLE_REGISTERS.items():
-            assert isinstance(allowed, frozenset), (
-                "Register %d should use frozenset" % reg
+            assert isinstance(allowed, (frozenset, range)), (
+                "Register %d should use frozenset or range" % reg
             )
 
+    def test_range_entries_are_step_one(self):
+        """Range entries must cover every value in their span."""
+        for reg, allowed in WRITABLE_REGISTERS.items():
+            if isinstance(allowed, range):
+                assert allowed.step == 1
+
     def test_boolean_registers(self):
         """Boolean registers should only allow 0 and 1."""
         for reg in [
@@ -324,9 +322,15 @@ class TestWriteValidation:
 
     def test_valid_write_succeeds(self):
         result = get_write_modbus(REGISTER_MODBUS_ADDRESS, REGISTER_USB_OUTPUT, 1)
-        assert isinstance(result, list)
+        assert isinstance(result, bytes)
         assert len(result) == 8
 
+    def test_repeat_write_is_cached(self):
+        """Memoized encoder returns the identical frozen frame object."""
+        cmd1 = get_write_modbus(REGISTER_MODBUS_ADDRESS, REGISTER_USB_OUTPUT, 1)
+        cmd2 = get_write_modbus(REGISTER_MODBUS_ADDRESS, REGISTER_USB_OUTPUT, 1)
+        assert cmd1 is cmd2
+
     def test_unknown_register_raises(self):
         with pytest.raises(ModbusValidationError, match="not in WRITABLE_REGISTERS"):
             get_write_modbus(REGISTER_MODBUS_ADDRESS, 999, 0)
@@ -390,10 +394,10 @@ class TestWriteValidation:
         """The validated path should produce the same bytes as the raw encoding."""
         # Build expected result manually using the low-level functions
         from fossibot_ha.sydpower.modbus import aa, int_to_high_low
-        a = int_to_high_low(1)
-        expected = aa(REGISTER_MODBUS_ADDRESS, REGISTER_USB_OUTPUT, [a['high'], a['low']], False)
+        high, low = int_to_high_low(1)
+        expected = aa(REGISTER_MODBUS_ADDRESS, REGISTER_USB_OUTPUT, [high, low], False)
         actual = get_write_modbus(REGISTER_MODBUS_ADDRESS, REGISTER_USB_OUTPUT, 1)
-        assert actual == expected
+        assert actual == bytes(expected)
 
 
 # ---------------------------------------------------------------------------